@@ -1,56 +1,116 @@
+import numpy as np
 import pandas as pd
 
 def monthly_kpis(df: pd.DataFrame):
-    df = df.copy()
-    df["order_month"] = df["order_date"].dt.to_period("M").astype(str)
-
-    monthly = (
-        df.groupby("order_month")
-        .agg(
-            revenue=("revenue", "sum"),
-            orders=("order_id", "nunique")
-        )
-        .reset_index()
+    # Work on raw arrays instead of groupby: truncating the dates to
+    # month resolution and factorizing gives integer month codes, so the
+    # aggregation is a pair of bincounts with no copy of the frame and
+    # no per-row string conversion. A precomputed order_month column
+    # (added by the app's load_data) skips the truncation entirely.
+    if "order_month" in df.columns:
+        months = df["order_month"].to_numpy().astype("datetime64[M]")
+    else:
+        months = df["order_date"].to_numpy().astype("datetime64[M]")
+    month_codes, month_labels = pd.factorize(months, sort=True)
+    month_labels = np.asarray(month_labels).astype("datetime64[M]")
+
+    revenue_values = df["revenue"].to_numpy()
+    order_ids = df["order_id"].to_numpy()
+
+    # Blank date cells survive parsing as NaT, which factorize encodes
+    # as -1; drop those rows before the bincounts choke on negative
+    # codes (groupby silently skipped them).
+    valid = month_codes >= 0
+    if not valid.all():
+        month_codes = month_codes[valid]
+        revenue_values = revenue_values[valid]
+        order_ids = order_ids[valid]
+
+    revenue = np.bincount(
+        month_codes, weights=revenue_values, minlength=len(month_labels)
     )
 
+    # One-row-per-order data (the common case here) needs no
+    # deduplication: the order count per month is just the group size.
+    if df["order_id"].is_unique:
+        # A lone null id still reads as unique but is not an order
+        # under nunique semantics, so count only the non-null rows.
+        has_order = pd.notna(order_ids)
+        if not has_order.all():
+            orders = np.bincount(
+                month_codes[has_order], minlength=len(month_labels)
+            )
+        else:
+            orders = np.bincount(month_codes, minlength=len(month_labels))
+    else:
+        # Factorize order_id, deduplicate the (month, order) pairs via
+        # a combined key, then count per month. Null ids factorize to
+        # -1 and never count as orders (nunique dropped them), so mask
+        # them out before the keys go negative.
+        order_codes, order_labels = pd.factorize(order_ids)
+        has_order = order_codes >= 0
+        pair_month_codes = month_codes
+        if not has_order.all():
+            order_codes = order_codes[has_order]
+            pair_month_codes = month_codes[has_order]
+        pair_keys = (
+            pair_month_codes.astype(np.int64) * len(order_labels)
+            + order_codes
+        )
+        unique_pairs = np.unique(pair_keys)
+        orders = np.bincount(
+            unique_pairs // len(order_labels),
+            minlength=len(month_labels)
+        )
+
+    monthly = pd.DataFrame({
+        "order_month": month_labels.astype(str),
+        "revenue": revenue,
+        "orders": orders
+    })
+
     monthly["aov"] = monthly["revenue"] / monthly["orders"]
     return monthly
 
 def revenue_decomposition(monthly_df: pd.DataFrame):
-    df = monthly_df.copy()
-    df["prev_revenue"] = df["revenue"].shift(1)
-    df["prev_orders"] = df["orders"].shift(1)
-    df["prev_aov"] = df["aov"].shift(1)
-
-    df["revenue_change"] = df["revenue"] - df["prev_revenue"]
-
-    # Decomposition logic
-    df["orders_effect"] = (df["orders"] - df["prev_orders"]) * df["prev_aov"]
-    df["aov_effect"] = (df["aov"] - df["prev_aov"]) * df["orders"]
-
-    df = df.dropna()
-
-    return df[
-        [
-            "order_month",
-            "revenue",
-            "revenue_change",
-            "orders_effect",
-            "aov_effect"
-        ]
-    ]
-
-def interpret_revenue_change(row):
-    messages = []
-
-    if row["orders_effect"] > 0:
-        messages.append("Increase driven by higher order volume")
-    else:
-        messages.append("Decrease driven by lower order volume")
+    revenue = monthly_df["revenue"].to_numpy()
+    orders = monthly_df["orders"].to_numpy()
+    aov = monthly_df["aov"].to_numpy()
 
-    if row["aov_effect"] > 0:
-        messages.append("Higher average order value helped")
-    else:
-        messages.append("Lower average order value impacted revenue")
+    # Decomposition logic: offset-by-one slices of the raw arrays stand
+    # in for shift(1), so there is no NaN padding to drop afterwards.
+    return pd.DataFrame({
+        "order_month": monthly_df["order_month"].to_numpy()[1:],
+        "revenue": revenue[1:],
+        "revenue_change": revenue[1:] - revenue[:-1],
+        "orders_effect": (orders[1:] - orders[:-1]) * aov[:-1],
+        "aov_effect": (aov[1:] - aov[:-1]) * orders[1:]
+    })
+
+# Indexed by (orders_effect > 0) * 2 + (aov_effect > 0), so the whole
+# interpretation is a table lookup instead of per-row branching.
+_CHANGE_MESSAGES = np.array([
+    "Decrease driven by lower order volume"
+    " & Lower average order value impacted revenue",
+    "Decrease driven by lower order volume"
+    " & Higher average order value helped",
+    "Increase driven by higher order volume"
+    " & Lower average order value impacted revenue",
+    "Increase driven by higher order volume"
+    " & Higher average order value helped"
+])
+
+def interpret_revenue_change(data):
+    """
+    Accepts either a single decomposition row or the whole
+    decomposition frame; the frame form is one vectorized lookup.
+    """
+    idx = (
+        (np.asarray(data["orders_effect"]) > 0) * 2
+        + (np.asarray(data["aov_effect"]) > 0)
+    )
+
+    if np.ndim(idx) == 0:
+        return _CHANGE_MESSAGES[idx]
 
-    return " & ".join(messages)
+    return pd.Series(_CHANGE_MESSAGES[idx], index=data.index)
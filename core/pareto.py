@@ -1,36 +1,46 @@
+import numpy as np
 import pandas as pd
 
-def pareto_products(df: pd.DataFrame, threshold: float = 0.8):
-    """
-    Returns product-level revenue contribution and Pareto flag.
-    """
-    product_rev = (
-        df.groupby("product_name")
-        .agg(revenue=("revenue", "sum"))
-        .sort_values("revenue", ascending=False)
-        .reset_index()
+def _pareto(df: pd.DataFrame, key: str, threshold: float):
+    # sort=False + observed=True skips pandas' group sort and empty
+    # category handling; shares come from one cumsum over the sorted
+    # revenue array instead of three separate column passes.
+    rev = (
+        df.groupby(key, sort=False, observed=True)["revenue"]
+        .sum()
+        .sort_values(ascending=False)
     )
 
-    total_revenue = product_rev["revenue"].sum()
-    product_rev["revenue_share"] = product_rev["revenue"] / total_revenue
-    product_rev["cumulative_share"] = product_rev["revenue_share"].cumsum()
+    values = rev.to_numpy()
 
-    product_rev["pareto_flag"] = product_rev["cumulative_share"] <= threshold
+    # No groups (empty frame or all-unobserved categories) means no
+    # total to divide by; return the empty frame with the usual shape.
+    if len(values) == 0:
+        return pd.DataFrame(
+            columns=[
+                key,
+                "revenue",
+                "revenue_share",
+                "cumulative_share",
+                "pareto_flag"
+            ]
+        )
 
-    return product_rev
+    cumulative = np.cumsum(values)
+    total = cumulative[-1]
 
-def pareto_categories(df: pd.DataFrame, threshold: float = 0.8):
-    category_rev = (
-        df.groupby("category")
-        .agg(revenue=("revenue", "sum"))
-        .sort_values("revenue", ascending=False)
-        .reset_index()
-    )
+    result = pd.DataFrame({key: rev.index, "revenue": values})
+    result["revenue_share"] = values / total
+    result["cumulative_share"] = cumulative / total
+    result["pareto_flag"] = result["cumulative_share"] <= threshold
 
-    total_revenue = category_rev["revenue"].sum()
-    category_rev["revenue_share"] = category_rev["revenue"] / total_revenue
-    category_rev["cumulative_share"] = category_rev["revenue_share"].cumsum()
+    return result
 
-    category_rev["pareto_flag"] = category_rev["cumulative_share"] <= threshold
+def pareto_products(df: pd.DataFrame, threshold: float = 0.8):
+    """
+    Returns product-level revenue contribution and Pareto flag.
+    """
+    return _pareto(df, "product_name", threshold)
 
-    return category_rev
+def pareto_categories(df: pd.DataFrame, threshold: float = 0.8):
+    return _pareto(df, "category", threshold)
@@ -40,17 +40,30 @@ def simulate_scenario(
     }
 
 def batch_simulation(baseline_revenue, scenarios):
-    results = []
+    scenario_df = pd.DataFrame(scenarios)
 
-    for s in scenarios:
-        outcome = simulate_scenario(
-            baseline_revenue,
-            s.get("price_change", 0),
-            s.get("volume_change", 0),
-            s.get("discount", 0)
-        )
+    # Whole grid in one vectorized expression rather than one Python
+    # call per scenario.
+    for col in ("price_change", "volume_change", "discount"):
+        if col not in scenario_df:
+            scenario_df[col] = 0.0
 
-        outcome.update(s)
-        results.append(outcome)
+    price = scenario_df["price_change"].fillna(0).to_numpy()
+    volume = scenario_df["volume_change"].fillna(0).to_numpy()
+    discount = scenario_df["discount"].fillna(0).to_numpy()
 
-    return pd.DataFrame(results)
+    simulated = (
+        baseline_revenue
+        * (1 + price / 100)
+        * (1 + volume / 100)
+        * (1 - discount / 100)
+    )
+    delta = simulated - baseline_revenue
+
+    results = pd.DataFrame({
+        "simulated_revenue": simulated,
+        "absolute_change": delta,
+        "percentage_change": (delta / baseline_revenue) * 100
+    })
+
+    return pd.concat([results, scenario_df], axis=1)